@@ -0,0 +1,19 @@
+"""
+Gunicorn settings for the DocumentDB API server
+
+    gunicorn api-server:app
+"""
+
+import multiprocessing
+import os
+
+bind = '0.0.0.0:10260'
+
+# gevent workers multiplex many requests blocked on MongoDB round-trips
+worker_class = 'gevent'
+workers = int(os.getenv('WEB_CONCURRENCY', multiprocessing.cpu_count() * 2 + 1))
+worker_connections = 1000
+keepalive = 30
+
+# Import the app in each worker after fork so every worker owns its MongoClient pool
+preload_app = False